@@ -1,9 +1,18 @@
+import os
+from pathlib import Path
+
 MAX_DATA_ROWS = 100
 
 MAX_DATA_CHARS = 30000
 
 TIMEOUT_SECONDS = 30.0
 
+MAX_CONNECTIONS = 100
+
+MAX_KEEPALIVE_CONNECTIONS = 20
+
+MAX_CONCURRENT_REQUESTS = 16
+
 MAX_RETRIES = 3
 
 CHUNK_SIZE = 10000
@@ -16,3 +25,8 @@ DEFAULT_COHERE_MODEL = "cohere:command-r"
 
 MARKITDOWN_TYPES = {"pptx", "docx", "xlsx", "xls", "pdf", "html"}
 TEXT_TYPES = {"md", "txt", "json", "xml", "yaml", "yml", "rtf"}
+
+CACHE_DIR = Path(os.getenv("TOOLFRONT_CACHE_DIR") or "~/.cache/toolfront").expanduser()
+
+# Seconds a cached OpenAPI spec is trusted without revalidation, 0 always revalidates
+SPEC_CACHE_TTL_SECONDS = float(os.getenv("TOOLFRONT_SPEC_CACHE_TTL", "3600"))
@@ -6,6 +6,7 @@ import click
 from mcp.server.fastmcp import FastMCP
 
 from toolfront.models.base import DataSource
+from toolfront.utils import prepare_tool_for_pydantic_ai
 
 logger = logging.getLogger("toolfront")
 logger.setLevel(logging.INFO)
@@ -26,7 +27,7 @@ async def get_mcp(url: str) -> FastMCP:
     mcp.add_tool(context)
 
     for tool in datasource.tools():
-        mcp.add_tool(tool, description=tool.__doc__)
+        mcp.add_tool(prepare_tool_for_pydantic_ai(tool), description=tool.__doc__)
 
     logger.info("Started ToolFront MCP server")
 
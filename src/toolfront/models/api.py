@@ -1,16 +1,110 @@
+import asyncio
+import functools
+import hashlib
 import json
+import logging
+import time
 from abc import ABC
 from enum import Enum
 from pathlib import Path
 from typing import Any
-from urllib.parse import urlparse
+from urllib.parse import quote, urlparse
 
 import httpx
 import yaml
-from pydantic import BaseModel, Field, computed_field, model_validator
-
-from toolfront.config import TIMEOUT_SECONDS
+from pydantic import BaseModel, Field, PrivateAttr, computed_field, model_validator
+
+from toolfront.config import (
+    CACHE_DIR,
+    MAX_CONCURRENT_REQUESTS,
+    MAX_CONNECTIONS,
+    MAX_KEEPALIVE_CONNECTIONS,
+    SPEC_CACHE_TTL_SECONDS,
+    TIMEOUT_SECONDS,
+)
 from toolfront.models.base import DataSource
+from toolfront.utils import is_private_dir, write_cache_file
+
+logger = logging.getLogger("toolfront")
+
+# Multiplex requests over one connection per host when the optional h2 package is installed
+try:
+    import h2  # noqa: F401
+
+    _HTTP2 = True
+except ImportError:
+    _HTTP2 = False
+
+# Use the libyaml-backed loader when PyYAML was built with it, large specs parse much faster
+_YAML_LOADER = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+
+
+@functools.cache
+def _get_spec_client() -> httpx.Client:
+    """Get the process-wide HTTP client used to fetch OpenAPI specs."""
+    return httpx.Client(
+        http2=_HTTP2,
+        timeout=TIMEOUT_SECONDS,
+        limits=httpx.Limits(
+            max_keepalive_connections=MAX_KEEPALIVE_CONNECTIONS,
+            max_connections=MAX_CONNECTIONS,
+        ),
+    )
+
+
+def _fetch_spec(url: str) -> dict:
+    """Fetch a remote OpenAPI spec, reusing a fresh cached copy or revalidating it with a conditional GET."""
+    spec_path = CACHE_DIR / "specs" / f"{hashlib.sha256(url.encode()).hexdigest()}.json"
+    meta_path = spec_path.with_suffix(".meta.json")
+    client = _get_spec_client()
+
+    # Another user could plant a spec whose server URL redirects authenticated requests, so only use a private cache
+    if not is_private_dir(spec_path.parent):
+        logger.warning(f"Not caching OpenAPI specs in {spec_path.parent}, it is writable by other users")
+        response = client.get(url)
+        response.raise_for_status()
+        return response.json()
+
+    # Trust a recently validated copy without touching the network
+    try:
+        if SPEC_CACHE_TTL_SECONDS > 0 and time.time() - meta_path.stat().st_mtime < SPEC_CACHE_TTL_SECONDS:
+            spec = json.loads(spec_path.read_text(encoding="utf-8"))
+            logger.debug(f"Using cached OpenAPI spec for {url}")
+            return spec
+    except (OSError, ValueError):
+        pass
+
+    headers = {}
+    try:
+        meta = json.loads(meta_path.read_text(encoding="utf-8"))
+        if meta.get("etag"):
+            headers["If-None-Match"] = meta["etag"]
+        if meta.get("last_modified"):
+            headers["If-Modified-Since"] = meta["last_modified"]
+    except (OSError, ValueError):
+        pass
+
+    response = client.get(url, headers=headers)
+
+    if response.status_code == 304:
+        try:
+            spec = json.loads(spec_path.read_text(encoding="utf-8"))
+            meta_path.touch()
+            return spec
+        except (OSError, ValueError):
+            # The cached body is gone or corrupt, so fetch it again unconditionally
+            response = client.get(url)
+
+    response.raise_for_status()
+    spec = response.json()
+
+    etag = response.headers.get("etag")
+    last_modified = response.headers.get("last-modified")
+    if etag or last_modified:
+        write_cache_file(spec_path, response.text)
+        write_cache_file(meta_path, json.dumps({"etag": etag, "last_modified": last_modified}))
+
+    return spec
 
 
 class HTTPMethod(str, Enum):
@@ -87,6 +181,10 @@ class API(DataSource, ABC):
     headers: dict[str, str] | None = Field(None, description="Additional headers to include in requests.", exclude=True)
     params: dict[str, str] | None = Field(None, description="Query parameters to include in requests.", exclude=True)
 
+    _client: httpx.AsyncClient | None = PrivateAttr(default=None)
+    _client_loop: asyncio.AbstractEventLoop | None = PrivateAttr(default=None)
+    _semaphore: asyncio.Semaphore | None = PrivateAttr(default=None)
+
     def __init__(
         self,
         spec: dict | str | None = None,
@@ -108,15 +206,17 @@ class API(DataSource, ABC):
             match parsed_url.scheme:
                 case "file":
                     path = Path(parsed_url.path)
-                    if not path.exists():
+                    try:
+                        with path.open() as f:
+                            v["spec"] = (
+                                yaml.load(f, Loader=_YAML_LOADER)
+                                if path.suffix.lower() in [".yaml", ".yml"]
+                                else json.load(f)
+                            )
+                    except FileNotFoundError:
                         raise ConnectionError(f"OpenAPI spec file not found: {path}")
-                    with path.open() as f:
-                        v["spec"] = yaml.safe_load(f) if path.suffix.lower() in [".yaml", ".yml"] else json.load(f)
                 case "http" | "https":
-                    with httpx.Client(timeout=TIMEOUT_SECONDS) as client:
-                        response = client.get(parsed_url.geturl())
-                        response.raise_for_status()
-                        v["spec"] = response.json()
+                    v["spec"] = _fetch_spec(parsed_url.geturl())
                 case _:
                     raise ValueError("Invalid API spec URL")
         elif not isinstance(spec, dict):
@@ -128,10 +228,11 @@ class API(DataSource, ABC):
         if not paths:
             raise RuntimeError("No endpoints found in OpenAPI spec")
 
+        supported_methods = HTTPMethod.get_supported_methods()
         endpoints = []
         for path, methods in paths.items():
             for method in methods:
-                if method.upper() in [http_method.value.upper() for http_method in HTTPMethod]:
+                if method.upper() in supported_methods:
                     endpoints.append(f"{method.upper()} {path}")
 
         v["endpoints"] = endpoints
@@ -146,6 +247,30 @@ class API(DataSource, ABC):
             return self.spec.get("servers", [{}])[0].get("url", "")
         return ""
 
+    def _get_client(self) -> httpx.AsyncClient:
+        """Get the pooled HTTP client bound to the running event loop."""
+        loop = asyncio.get_running_loop()
+        if self._client is None or self._client_loop is not loop:
+            self._client = httpx.AsyncClient(
+                http2=_HTTP2,
+                timeout=TIMEOUT_SECONDS,
+                limits=httpx.Limits(
+                    max_keepalive_connections=MAX_KEEPALIVE_CONNECTIONS,
+                    max_connections=MAX_CONNECTIONS,
+                ),
+            )
+            self._client_loop = loop
+            self._semaphore = asyncio.Semaphore(MAX_CONCURRENT_REQUESTS)
+        return self._client
+
+    async def aclose(self) -> None:
+        """Close the pooled HTTP client."""
+        if self._client is not None and self._client_loop is asyncio.get_running_loop():
+            await self._client.aclose()
+        self._client = None
+        self._client_loop = None
+        self._semaphore = None
+
     def tools(self) -> list[callable]:
         """Available tool methods for API operations.
 
@@ -186,13 +311,17 @@ class API(DataSource, ABC):
         3. When a request fails or returns unexpected results, examine the endpoint to diagnose the issue and then retry.
         """
 
-        async with httpx.AsyncClient(timeout=TIMEOUT_SECONDS) as client:
+        # Percent-encode path parameters so values can't add segments or break the URL
+        path_params = {k: quote(str(v), safe="") for k, v in (request.path_params or {}).items()}
+
+        client = self._get_client()
+        async with self._semaphore:
             response = await client.request(
                 method=request.endpoint.method.upper(),
-                url=f"{self.url}{request.endpoint.path.format(**(request.path_params or {}))}",
+                url=f"{self.url}{request.endpoint.path.format(**path_params)}",
                 json=request.body,
                 params={**(request.params or {}), **(self.params or {})},
                 headers={**(request.headers or {}), **(self.headers or {})},
             )
-            response.raise_for_status()
-            return response.json()
+        response.raise_for_status()
+        return response.json()
@@ -6,7 +6,7 @@ from importlib.resources import files
 from typing import Any, Self
 
 import yaml
-from pydantic import BaseModel
+from pydantic import BaseModel, PrivateAttr
 from pydantic_ai import Agent, Tool, UnexpectedModelBehavior, models
 from pydantic_ai.messages import (
     FunctionToolCallEvent,
@@ -36,10 +36,15 @@ from toolfront.utils import (
 logger = logging.getLogger("toolfront")
 console = Console()
 
+# Use the libyaml-backed dumper when PyYAML was built with it
+_YAML_DUMPER = getattr(yaml, "CDumper", yaml.Dumper)
+
 
 class DataSource(BaseModel, ABC):
     """Abstract base class for all datasources."""
 
+    _agent_tools: list[Tool] | None = PrivateAttr(default=None)
+
     def __repr__(self) -> str:
         dump = self.model_dump()
         args = ", ".join(f"{k}={repr(v)}" for k, v in dump.items())
@@ -72,6 +77,18 @@ class DataSource(BaseModel, ABC):
     def tools(self) -> list[callable]:
         raise NotImplementedError("Subclasses must implement tools")
 
+    def _get_agent_tools(self) -> list[Tool]:
+        """Get the datasource tools wrapped for pydantic-ai, building them once per instance."""
+        if self._agent_tools is None:
+            self._agent_tools = [
+                Tool(prepare_tool_for_pydantic_ai(tool), max_retries=MAX_RETRIES) for tool in self.tools()
+            ]
+        return self._agent_tools
+
+    async def aclose(self) -> None:
+        """Release resources held open between tool calls."""
+        return None
+
     def instructions(self, context: str | None = None) -> str:
         """Generate system instructions for AI agents.
 
@@ -96,7 +113,7 @@ class DataSource(BaseModel, ABC):
         return (
             f"{agent_instruction}\n\n"
             f"Use the following information about the user's data to guide your response:\n\n"
-            f"{yaml.dump(self.model_dump())}"
+            f"{yaml.dump(self.model_dump(), Dumper=_YAML_DUMPER)}"
         )
 
     def ask(
@@ -133,11 +150,9 @@ class DataSource(BaseModel, ABC):
         output_type = get_output_type_hint() or output_type or str
 
         system_prompt = self.instructions(context=context)
-        tools = [Tool(prepare_tool_for_pydantic_ai(tool), max_retries=MAX_RETRIES) for tool in self.tools()]
-
         agent = Agent(
             model=model,
-            tools=tools,
+            tools=self._get_agent_tools(),
             system_prompt=system_prompt,
             output_retries=MAX_RETRIES,
             output_type=output_type,
@@ -220,3 +235,5 @@ class DataSource(BaseModel, ABC):
         except UnexpectedModelBehavior as e:
             logger.error(f"Unexpected model behavior: {e}", exc_info=True)
             raise RuntimeError(f"Unexpected model behavior: {e}")
+        finally:
+            await self.aclose()
@@ -1,3 +1,4 @@
+import functools
 import logging
 import re
 import warnings
@@ -8,19 +9,75 @@ from urllib.parse import urlparse
 
 import ibis
 import pandas as pd
+import pyarrow as pa
 import yaml
 from ibis import BaseBackend
 from pydantic import BaseModel, Field, PrivateAttr, computed_field, field_serializer, model_validator
 from pydantic_ai import ModelRetry
 from sqlglot.optimizer import optimize
 
+from toolfront.config import MAX_DATA_ROWS
 from toolfront.models.base import DataSource
-from toolfront.utils import sanitize_url
+from toolfront.utils import row_truncation_message, sanitize_url
 
 logger = logging.getLogger("toolfront")
 
 T = TypeVar("T", bound=BaseModel)
 
+# Write operations that make a query non-read-only
+_WRITE_OPERATIONS = [
+    "INSERT",
+    "UPDATE",
+    "DELETE",
+    "DROP",
+    "CREATE",
+    "ALTER",
+    "TRUNCATE",
+    "REPLACE",
+    "MERGE",
+    "UPSERT",
+    "GRANT",
+    "REVOKE",
+    "EXEC",
+    "EXECUTE",
+    "CALL",
+]
+
+# Matches any write operation as a complete word, compiled once rather than on every check
+_WRITE_OPERATIONS_PATTERN = re.compile(r"\b(?:" + "|".join(_WRITE_OPERATIONS) + r")\b", re.IGNORECASE)
+
+# Filter patterns that match every name, applying them would only cost a regex search per name
+_MATCH_ALL_PATTERNS = {".*", ".+", "^.*$", "^.+$"}
+
+
+def _fetch(expr: "ibis.Table") -> pa.Table | pd.DataFrame:
+    """Execute an ibis expression to Arrow, falling back to pandas for types ibis cannot convert to Arrow."""
+    try:
+        return expr.to_pyarrow()
+    except pa.ArrowNotImplementedError:
+        # e.g. DuckDB INTERVAL columns, which ibis fails to cast to an Arrow duration
+        return expr.to_pandas()
+
+
+@functools.lru_cache(maxsize=128)
+def _query_instructions(row_type: type[BaseModel]) -> str:
+    """Build the query field instructions for a Table parameterized with row_type."""
+    # Read the query instructions template
+    instruction_file = files("toolfront") / "instructions" / "query.txt"
+    with instruction_file.open() as f:
+        instructions = f.read()
+
+    # Generate field descriptions from the model as YAML dict
+    fields_dict = {}
+    for field_name, field_info in row_type.model_fields.items():
+        field_type = field_info.annotation
+        type_name = field_type.__name__ if hasattr(field_type, "__name__") else str(field_type)
+        fields_dict[field_name] = type_name
+
+    fields_yaml = yaml.dump(fields_dict, default_flow_style=False)
+
+    return instructions + "Required fields:\n" + fields_yaml
+
 
 class Table(BaseModel):
     path: str = Field(
@@ -34,30 +91,8 @@ class Query(BaseModel):
 
     def is_read_only_query(self) -> bool:
         """Check if SQL contains only read operations"""
-        # Define write operations that make a query non-read-only
-        write_operations = [
-            "INSERT",
-            "UPDATE",
-            "DELETE",
-            "DROP",
-            "CREATE",
-            "ALTER",
-            "TRUNCATE",
-            "REPLACE",
-            "MERGE",
-            "UPSERT",
-            "GRANT",
-            "REVOKE",
-            "EXEC",
-            "EXECUTE",
-            "CALL",
-        ]
-
-        # Create regex pattern that matches any write operation as a complete word
-        pattern = r"\b(?:" + "|".join(write_operations) + r")\b"
-
         # Return True if NO write operations are found (case insensitive)
-        return not bool(re.search(pattern, self.code, re.IGNORECASE))
+        return _WRITE_OPERATIONS_PATTERN.search(self.code) is None
 
     def optimized_code(self, dialect: str) -> str:
         return optimize(self.code, dialect=dialect).sql(dialect=dialect)
@@ -95,7 +130,7 @@ class Database(DataSource, ABC):
         exclude=True,
     )
 
-    _tables: list[str] = PrivateAttr(default_factory=list)
+    _tables: list[str] | None = PrivateAttr(default=None)
 
     def __init__(
         self,
@@ -134,7 +169,7 @@ class Database(DataSource, ABC):
         return parsed.scheme.lower()
 
     @model_validator(mode="after")
-    def validate_and_discover_tables(self) -> "Database":
+    def validate_patterns(self) -> "Database":
         # Validate regex patterns
         if self.match_schema:
             if not isinstance(self.match_schema, str):
@@ -152,17 +187,24 @@ class Database(DataSource, ABC):
             except re.error as e:
                 raise ValueError(f"Invalid regex pattern for match_tables: {self.match_tables} - {str(e)}")
 
+        return self
+
+    def _discover_tables(self) -> list[str]:
+        """List the tables matching the schema and table patterns."""
+        match_schema = None if self.match_schema in _MATCH_ALL_PATTERNS else self.match_schema
+        match_tables = None if self.match_tables in _MATCH_ALL_PATTERNS else self.match_tables
+
         try:
             catalog = getattr(self.connection, "current_catalog", None)
             if catalog:
-                databases = self.connection.list_databases(catalog=catalog, like=self.match_schema)
+                databases = self.connection.list_databases(catalog=catalog, like=match_schema)
                 all_tables = []
                 for db in databases:
-                    tables = self.connection.list_tables(like=self.match_tables, database=(catalog, db))
+                    tables = self.connection.list_tables(like=match_tables, database=(catalog, db))
                     prefix = f"{catalog}." if catalog else ""
                     all_tables.extend([f"{prefix}{db}.{table}" for table in tables])
             else:
-                all_tables = self.connection.list_tables(like=self.match_tables)
+                all_tables = self.connection.list_tables(like=match_tables)
         except Exception as e:
             logger.error(f"Failed to discover tables automatically: {e}")
             raise RuntimeError(f"Could not list tables from database: {str(e)}") from e
@@ -170,9 +212,7 @@ class Database(DataSource, ABC):
         if not all_tables:
             logger.warning("No tables found in the database - this may be expected for empty databases")
 
-        self._tables = all_tables
-
-        return self
+        return all_tables
 
     @field_serializer("url")
     def serialize_url(self, value: str) -> str:
@@ -198,6 +238,9 @@ class Database(DataSource, ABC):
     @computed_field
     @property
     def tables(self) -> list[str]:
+        # Discovery needs a round trip per schema, so defer it until the tables are actually needed
+        if self._tables is None:
+            self._tables = self._discover_tables()
         return self._tables
 
     @classmethod
@@ -1081,14 +1124,33 @@ class Database(DataSource, ABC):
         try:
             logger.debug(f"Inspecting table: {self.url} {table.path}")
             inspected_table = self[table.path]
+            # Build the schema summary locally, Table.info() would scan the whole table to count nulls
+            schema = inspected_table.schema()
             return {
-                "schema": inspected_table.info()[["name", "type", "nullable"]].to_pandas(),
-                "samples": inspected_table.head(5).to_pandas(),
+                "schema": pa.table(
+                    {
+                        "name": list(schema.names),
+                        "type": [str(dtype) for dtype in schema.types],
+                        "nullable": [dtype.nullable for dtype in schema.types],
+                    }
+                ),
+                "samples": _fetch(inspected_table.head(5)),
             }
         except Exception as e:
             logger.error(f"Failed to inspect table: {e}", exc_info=True)
             raise ModelRetry(f"Failed to inspect table: {str(e)}") from e
 
+    def _sql(self, query: Query) -> "ibis.Table":
+        """Validate a read-only query and build its ibis expression."""
+        logger.debug(f"Querying database: {self.url} {query.code}")
+        if not query.is_read_only_query():
+            raise ValueError("Only read-only queries are allowed")
+
+        if not hasattr(self.connection, "raw_sql"):
+            raise ValueError("Database does not support raw sql queries")
+
+        return self.connection.sql(query.optimized_code(self.database_type))
+
     async def query(
         self,
         query: Query = Field(..., description="Read-only SQL query to execute."),
@@ -1104,16 +1166,15 @@ class Database(DataSource, ABC):
         4. When a query fails or returns unexpected results, try to diagnose the issue and then retry.
         """
         try:
-            logger.debug(f"Querying database: {self.url} {query.code}")
-            if not query.is_read_only_query():
-                raise ValueError("Only read-only queries are allowed")
+            result = self._sql(query)
 
-            if not hasattr(self.connection, "raw_sql"):
-                raise ValueError("Database does not support raw sql queries")
+            # Only fetch the rows that will be shown, plus one to detect truncation
+            data = _fetch(result.limit(MAX_DATA_ROWS + 1))
+            if len(data) <= MAX_DATA_ROWS:
+                return data
 
-            result = self.connection.sql(query.optimized_code(self.database_type))
-
-            return result.to_pandas()
+            # Counting the full result would run the query a second time, so the total stays unknown
+            return {"data": data[:MAX_DATA_ROWS], "truncation_message": row_truncation_message()}
         except Exception as e:
             logger.error(f"Failed to query database: {e}", exc_info=True)
             raise ModelRetry(f"Failed to query database: {str(e)}") from e
@@ -1121,11 +1182,7 @@ class Database(DataSource, ABC):
     def _query_sync(self, query: Query) -> pd.DataFrame:
         """Synchronous version of query method for internal use."""
         try:
-            logger.debug(f"Querying database: {self.url} {query.code}")
-            if not query.is_read_only_query():
-                raise ValueError("Only read-only queries are allowed")
-
-            return self.connection.sql(query.optimized_code(self.database_type)).to_pandas()
+            return self._sql(query).to_pandas()
         except Exception as e:
             logger.error(f"Failed to query database: {e}", exc_info=True)
             raise RuntimeError(f"Failed to query database:{str(e)}") from e
@@ -1143,21 +1200,7 @@ class Database(DataSource, ABC):
 
             def __class_getitem__(cls, item):
                 """Capture the generic type parameter and create a new class with _model_type set."""
-                # Read the query instructions template
-                instruction_file = files("toolfront") / "instructions" / "query.txt"
-                with instruction_file.open() as f:
-                    instructions = f.read()
-
-                # Generate field descriptions from the model as YAML dict
-                fields_dict = {}
-                for field_name, field_info in item.model_fields.items():
-                    field_type = field_info.annotation
-                    type_name = field_type.__name__ if hasattr(field_type, "__name__") else str(field_type)
-                    fields_dict[field_name] = type_name
-
-                fields_yaml = yaml.dump(fields_dict, default_flow_style=False)
-
-                instructions += "Required fields:\n" + fields_yaml
+                instructions = _query_instructions(item)
 
                 class ParameterizedTable(cls):
                     _row_type: type[T] = PrivateAttr(default=item)
@@ -1205,10 +1248,13 @@ class Database(DataSource, ABC):
                 return len(self._data)
 
             def __iter__(self):
-                for _, row in self._data.iterrows():
+                # Build plain dicts lazily from tuples instead of materializing a Series per row
+                columns = list(self._data.columns)
+                for values in self._data.itertuples(index=False, name=None):
+                    row = dict(zip(columns, values, strict=True))
                     if self._row_type is not None:
-                        yield self._row_type(**row.to_dict())
+                        yield self._row_type(**row)
                     else:
-                        yield row.to_dict()
+                        yield row
 
         return Table
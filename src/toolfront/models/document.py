@@ -1,11 +1,15 @@
+import hashlib
+import io
 from pathlib import Path
 from typing import Any
 
-from markitdown import MarkItDown
+from markitdown import MarkItDown, StreamInfo
+from markitdown import __version__ as markitdown_version
 from pydantic import BaseModel, Field, model_validator
 
-from toolfront.config import CHUNK_SIZE, MARKITDOWN_TYPES, TEXT_TYPES
+from toolfront.config import CACHE_DIR, CHUNK_SIZE, MARKITDOWN_TYPES, TEXT_TYPES
 from toolfront.models.base import DataSource
+from toolfront.utils import write_cache_file
 
 
 class Pagination(BaseModel):
@@ -24,6 +28,8 @@ class Document(DataSource):
         Path to document file. Mutually exclusive with text.
     text : str, optional
         Document content as text. Mutually exclusive with source.
+    cache : bool, optional
+        Whether to cache converted documents on disk, by default True.
     """
 
     source: str | None = Field(
@@ -34,9 +40,14 @@ class Document(DataSource):
         description="Document content as text. If None, the document source path must be provided directly via the source parameter. Mutually exclusive with source.",
         exclude=True,
     )
+    cache: bool = Field(
+        default=True,
+        description="Whether to cache the markdown conversion of the source document on disk.",
+        exclude=True,
+    )
 
-    def __init__(self, source: str | None = None, text: str | None = None, **kwargs: Any) -> None:
-        super().__init__(source=source, text=text, **kwargs)
+    def __init__(self, source: str | None = None, text: str | None = None, cache: bool = True, **kwargs: Any) -> None:
+        super().__init__(source=source, text=text, cache=cache, **kwargs)
 
     @model_validator(mode="before")
     def validate_model(cls, v: Any) -> Any:
@@ -56,30 +67,52 @@ class Document(DataSource):
 
         # Process source
         source_path = Path(source_value)
-        if not source_path.exists():
-            raise ValueError(f"Document path does not exist: {source_path}")
 
         # Extract file extension (without the dot)
         document_type = source_path.suffix[1:].lower() if source_path.suffix else ""
 
         # Read document based on type
-        document_content = cls._read_document_content(source_path, document_type)
+        try:
+            document_content = cls._read_document_content(source_path, document_type, cache=v.get("cache", True))
+        except FileNotFoundError:
+            raise ValueError(f"Document path does not exist: {source_path}")
         v["text"] = document_content
 
         return v
 
     @classmethod
-    def _read_document_content(cls, source_path: Path, document_type: str) -> str:
+    def _read_document_content(cls, source_path: Path, document_type: str, cache: bool = True) -> str:
         """Read document content based on file type."""
         if document_type in MARKITDOWN_TYPES:
-            md = MarkItDown()
-            result = md.convert(source_path)
-            return result.markdown
+            return cls._convert_document(source_path, cache=cache)
         elif document_type in TEXT_TYPES:
             return source_path.read_text(encoding="utf-8")
         else:
             raise ValueError(f"Unsupported document type: {document_type}")
 
+    @classmethod
+    def _convert_document(cls, source_path: Path, cache: bool = True) -> str:
+        """Convert a document to markdown, reusing the cached conversion of identical content."""
+        # Read the file once and use the same bytes for both the cache key and the conversion
+        content = source_path.read_bytes()
+        stream_info = StreamInfo(extension=source_path.suffix, filename=source_path.name, local_path=str(source_path))
+        if not cache:
+            return MarkItDown().convert_stream(io.BytesIO(content), stream_info=stream_info).markdown
+
+        # The converter is chosen by extension and its output changes across markitdown releases
+        cache_key = hashlib.sha256(content)
+        cache_key.update(f"{source_path.suffix}:{markitdown_version}".encode())
+        cache_path = CACHE_DIR / "documents" / f"{cache_key.hexdigest()}.md"
+
+        try:
+            return cache_path.read_text(encoding="utf-8")
+        except FileNotFoundError:
+            pass
+
+        markdown = MarkItDown().convert_stream(io.BytesIO(content), stream_info=stream_info).markdown
+        write_cache_file(cache_path, markdown)
+        return markdown
+
     def tools(self) -> list[callable]:
         """Available tool methods for document operations.
 
@@ -4,11 +4,15 @@ import inspect
 import json
 import logging
 import os
+import tempfile
 from collections.abc import Callable
+from pathlib import Path
 from typing import Any, get_args, get_origin
 
 import executing
 import pandas as pd
+import pyarrow as pa
+import pyarrow.csv as pa_csv
 from pydantic import TypeAdapter
 from pydantic_ai import ModelRetry
 from yarl import URL
@@ -26,6 +30,8 @@ from toolfront.config import (
 logger = logging.getLogger("toolfront")
 logger.setLevel(logging.INFO)
 
+_ANY_ADAPTER = TypeAdapter(Any)
+
 
 def prepare_tool_for_pydantic_ai(func: Callable[..., Any]) -> Callable[..., Any]:
     """
@@ -52,7 +58,8 @@ def prepare_tool_for_pydantic_ai(func: Callable[..., Any]) -> Callable[..., Any]
             logger.error(f"Tool {func.__name__} failed: {e}", exc_info=True)
             raise ModelRetry(f"Tool {func.__name__} failed: {str(e)}") from e
 
-    wrapper.__signature__ = sig
+    # The wrapper returns serialized output, not the wrapped function's return type
+    wrapper.__signature__ = sig.replace(return_annotation=Any)
 
     return wrapper
 
@@ -69,6 +76,16 @@ def serialize_response(response: Any) -> Any:
         Serialized response with optional truncation message
     """
 
+    if isinstance(response, pa.Table | pa.RecordBatch):
+        # Write CSV straight from Arrow, skipping the conversion to pandas
+        if response.num_rows > MAX_DATA_ROWS:
+            return {
+                "data": _arrow_to_csv(response.slice(0, MAX_DATA_ROWS)),
+                "truncation_message": row_truncation_message(response.num_rows),
+            }
+
+        return _arrow_to_csv(response)
+
     if isinstance(response, pd.DataFrame):
         # Truncate by rows if needed
         if len(response) > MAX_DATA_ROWS:
@@ -76,15 +93,14 @@ def serialize_response(response: Any) -> Any:
             json_str = truncated_df.to_csv(index=False)
             return {
                 "data": json_str,
-                "truncation_message": f"Showing {MAX_DATA_ROWS:,} rows of {len(response):,} total rows",
+                "truncation_message": row_truncation_message(len(response)),
             }
 
         # Convert to JSON string
         return response.to_csv(index=False)
 
     # For all other types, use pydantic TypeAdapter
-    adapter = TypeAdapter(Any)
-    serialized = adapter.dump_python(response, mode="json")
+    serialized = _ANY_ADAPTER.dump_python(response, mode="json")
 
     # Convert to JSON string to check character count
     json_str = json.dumps(serialized)
@@ -100,6 +116,28 @@ def serialize_response(response: Any) -> Any:
     return serialized
 
 
+def row_truncation_message(total_rows: int | None = None) -> str:
+    """Describe a result truncated to MAX_DATA_ROWS rows, with total_rows None when the total is unknown."""
+    if total_rows is None:
+        return f"Showing {MAX_DATA_ROWS:,} rows of more than {MAX_DATA_ROWS:,} total rows"
+    return f"Showing {MAX_DATA_ROWS:,} rows of {total_rows:,} total rows"
+
+
+def _arrow_to_csv(data: pa.Table | pa.RecordBatch) -> str:
+    """Render Arrow data as a CSV string, falling back to pandas for types Arrow's CSV writer mishandles."""
+    # Arrow writes durations as bare integers with no unit, pandas renders them as e.g. "0 days 00:00:05"
+    if any(pa.types.is_duration(dtype) or pa.types.is_interval(dtype) for dtype in data.schema.types):
+        return data.to_pandas().to_csv(index=False)
+
+    sink = pa.BufferOutputStream()
+    try:
+        pa_csv.write_csv(data, sink)
+    except (pa.ArrowInvalid, pa.ArrowNotImplementedError):
+        # Nested (list/struct/map) and non-UTF-8 binary columns are not CSV-writable in Arrow
+        return data.to_pandas().to_csv(index=False)
+    return sink.getvalue().to_pybytes().decode("utf-8")
+
+
 def deserialize_response(tool_result: Any) -> str:
     """Format tool result with proper type handling and truncation."""
     # Handle dict/object results - recursively process each key-value pair
@@ -120,8 +158,9 @@ def deserialize_response(tool_result: Any) -> str:
         try:
             from io import StringIO
 
-            df = pd.read_csv(StringIO(tool_result))
-            return f"\n{df.head(10).to_markdown()}\n"
+            # Only the first rows are displayed, so stop parsing once they are read
+            df = pd.read_csv(StringIO(tool_result), nrows=10)
+            return f"\n{df.to_markdown()}\n"
         except Exception:
             # Fallback: treat as raw string and truncate if too long
             if len(tool_result) > 10000:
@@ -153,6 +192,49 @@ def deserialize_response(tool_result: Any) -> str:
         return f"```\n{tool_result_str}\n```"
 
 
+def is_private_dir(path: Path) -> bool:
+    """Check that a cache directory is missing, or owned by the current user and not writable by others."""
+    if not hasattr(os, "getuid"):
+        return True
+    try:
+        stat = path.stat()
+    except FileNotFoundError:
+        return True
+    except OSError:
+        return False
+    return stat.st_uid == os.getuid() and not stat.st_mode & 0o022
+
+
+def write_cache_file(path: Path, content: str) -> None:
+    """
+    Atomically write a file to the on-disk cache.
+
+    The content is written to a temporary file and renamed into place so concurrent readers
+    never see a partial write. Failures are logged rather than raised since the cache is optional.
+
+    Args:
+        path: Destination path of the cache file
+        content: Text content to write
+    """
+    try:
+        # Create missing directories private to the current user, mkdir(parents=True) ignores mode for parents
+        missing_dirs = [directory for directory in (path.parent, *path.parent.parents) if not directory.exists()]
+        for directory in reversed(missing_dirs):
+            directory.mkdir(mode=0o700, exist_ok=True)
+        fd, tmp_name = tempfile.mkstemp(dir=path.parent, prefix=f".{path.name}.", suffix=".tmp")
+        tmp_path = Path(tmp_name)
+        try:
+            with os.fdopen(fd, "w", encoding="utf-8") as f:
+                f.write(content)
+            tmp_path.replace(path)
+        except BaseException:
+            tmp_path.unlink(missing_ok=True)
+            raise
+    except OSError as e:
+        logger.debug(f"Could not write cache file {path}: {e}")
+
+
+@functools.lru_cache(maxsize=128)
 def sanitize_url(url: str) -> str:
     """Sanitize the url by removing the password."""
     url = URL(url)
@@ -5,6 +5,8 @@ import os
 import pandas as pd
 import pytest
 
+from toolfront.models.database import Database
+
 # Note: pytest-asyncio needed for async tests
 
 
@@ -77,3 +79,11 @@ def sqlite_url():
 def duckdb_url():
     """DuckDB connection URL for integration tests."""
     return "duckdb:///:memory:"
+
+
+@pytest.fixture(scope="class")
+def duckdb_database():
+    """In-memory DuckDB database with a users table, built once per test class."""
+    database = Database("duckdb://")
+    database.connection.raw_sql("CREATE TABLE users (id INTEGER NOT NULL, name VARCHAR)")
+    return database
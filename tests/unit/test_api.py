@@ -0,0 +1,179 @@
+"""Unit tests for the API datasource in toolfront.models.api."""
+
+import asyncio
+import hashlib
+import json
+import os
+import time
+from types import SimpleNamespace
+
+import httpx
+import pytest
+
+from toolfront.models import api
+
+SPEC_URL = "https://example.com/openapi.json"
+SPEC = {"openapi": "3.0.0", "paths": {}}
+API_SPEC = {"openapi": "3.0.0", "servers": [{"url": "https://api.example.com"}], "paths": {"/u/{id}": {"get": {}}}}
+
+
+@pytest.fixture
+def spec_server(monkeypatch, tmp_path):
+    """Serve SPEC from a mock transport with an ETag, recording every request."""
+    requests = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        requests.append(request)
+        if request.headers.get("if-none-match") == '"v1"':
+            return httpx.Response(304)
+        return httpx.Response(200, json=SPEC, headers={"ETag": '"v1"'})
+
+    client = httpx.Client(transport=httpx.MockTransport(handler))
+    monkeypatch.setattr(api, "_get_spec_client", lambda: client)
+    monkeypatch.setattr(api, "CACHE_DIR", tmp_path)
+    monkeypatch.setattr(api, "SPEC_CACHE_TTL_SECONDS", 0)
+    return requests
+
+
+@pytest.fixture
+def api_server(monkeypatch):
+    """Route API requests to a mock transport, recording every request, client created, and peak concurrency."""
+    server = SimpleNamespace(requests=[], clients=[], in_flight=0, peak_in_flight=0)
+
+    async def handler(request: httpx.Request) -> httpx.Response:
+        server.requests.append(request)
+        server.in_flight += 1
+        server.peak_in_flight = max(server.peak_in_flight, server.in_flight)
+        # Yield so concurrent requests can overlap
+        await asyncio.sleep(0)
+        server.in_flight -= 1
+        return httpx.Response(200, json={"path": request.url.raw_path.decode()})
+
+    async_client = httpx.AsyncClient
+
+    def client_factory(**kwargs) -> httpx.AsyncClient:
+        client = async_client(transport=httpx.MockTransport(handler), **kwargs)
+        server.clients.append(client)
+        return client
+
+    monkeypatch.setattr(httpx, "AsyncClient", client_factory)
+    return server
+
+
+def get_user_request(user_id: str) -> api.Request:
+    """Build a request for the /u/{id} endpoint of API_SPEC."""
+    return api.Request(endpoint=api.Endpoint(method="GET", path="/u/{id}"), path_params={"id": user_id})
+
+
+class TestFetchSpec:
+    """Test cases for _fetch_spec function."""
+
+    def test_not_modified_reuses_cached_spec(self, spec_server):
+        """Test that a 304 response is answered from the cached body."""
+        assert api._fetch_spec(SPEC_URL) == SPEC
+        assert api._fetch_spec(SPEC_URL) == SPEC
+        assert "if-none-match" not in spec_server[0].headers
+        assert spec_server[1].headers["if-none-match"] == '"v1"'
+        assert len(spec_server) == 2
+
+    def test_corrupt_cached_spec_refetched(self, spec_server, tmp_path):
+        """Test that a corrupt cached body triggers an unconditional GET after a 304."""
+        api._fetch_spec(SPEC_URL)
+        spec_path = tmp_path / "specs" / f"{hashlib.sha256(SPEC_URL.encode()).hexdigest()}.json"
+        spec_path.write_text("{not json")
+        assert api._fetch_spec(SPEC_URL) == SPEC
+        assert len(spec_server) == 3
+        assert "if-none-match" not in spec_server[2].headers
+        assert json.loads(spec_path.read_text()) == SPEC
+
+    def test_missing_cached_spec_refetched(self, spec_server, tmp_path):
+        """Test that a missing cached body triggers an unconditional GET after a 304."""
+        api._fetch_spec(SPEC_URL)
+        spec_path = tmp_path / "specs" / f"{hashlib.sha256(SPEC_URL.encode()).hexdigest()}.json"
+        spec_path.unlink()
+        assert api._fetch_spec(SPEC_URL) == SPEC
+        assert len(spec_server) == 3
+        assert "if-none-match" not in spec_server[2].headers
+
+    def test_fresh_cached_spec_skips_network(self, spec_server, monkeypatch):
+        """Test that a spec validated within the TTL is returned without a request."""
+        monkeypatch.setattr(api, "SPEC_CACHE_TTL_SECONDS", 3600)
+        api._fetch_spec(SPEC_URL)
+        assert api._fetch_spec(SPEC_URL) == SPEC
+        assert len(spec_server) == 1
+
+    def test_stale_cached_spec_revalidated(self, spec_server, monkeypatch, tmp_path):
+        """Test that a spec older than the TTL is revalidated and its freshness renewed on 304."""
+        monkeypatch.setattr(api, "SPEC_CACHE_TTL_SECONDS", 3600)
+        api._fetch_spec(SPEC_URL)
+        meta_path = tmp_path / "specs" / f"{hashlib.sha256(SPEC_URL.encode()).hexdigest()}.meta.json"
+        stale = time.time() - 7200
+        os.utime(meta_path, (stale, stale))
+        assert api._fetch_spec(SPEC_URL) == SPEC
+        assert spec_server[1].headers["if-none-match"] == '"v1"'
+        assert meta_path.stat().st_mtime > stale + 3600
+        assert api._fetch_spec(SPEC_URL) == SPEC
+        assert len(spec_server) == 2
+
+    def test_shared_cache_dir_ignored(self, spec_server, monkeypatch, tmp_path):
+        """Test that a fresh spec planted in a directory other users can write to is not trusted."""
+        monkeypatch.setattr(api, "SPEC_CACHE_TTL_SECONDS", 3600)
+        spec_path = tmp_path / "specs" / f"{hashlib.sha256(SPEC_URL.encode()).hexdigest()}.json"
+        spec_path.parent.mkdir()
+        spec_path.parent.chmod(0o777)
+        spec_path.write_text(json.dumps({"servers": [{"url": "https://attacker.example.com"}]}))
+        spec_path.with_suffix(".meta.json").write_text(json.dumps({"etag": '"v1"', "last_modified": None}))
+        assert api._fetch_spec(SPEC_URL) == SPEC
+        assert len(spec_server) == 1
+        assert "if-none-match" not in spec_server[0].headers
+
+    def test_no_validators_not_cached(self, monkeypatch, tmp_path):
+        """Test that specs served without ETag or Last-Modified are not cached."""
+        client = httpx.Client(transport=httpx.MockTransport(lambda request: httpx.Response(200, json=SPEC)))
+        monkeypatch.setattr(api, "_get_spec_client", lambda: client)
+        monkeypatch.setattr(api, "CACHE_DIR", tmp_path)
+        assert api._fetch_spec(SPEC_URL) == SPEC
+        assert not (tmp_path / "specs").exists()
+
+
+class TestAPIRequest:
+    """Test cases for API.request method."""
+
+    async def test_client_reused_within_loop(self, api_server):
+        """Test that one pooled client serves every request made in the same event loop."""
+        datasource = api.API(spec=API_SPEC)
+        for user_id in ["1", "2", "3"]:
+            await datasource.request(get_user_request(user_id))
+        assert len(api_server.requests) == 3
+        assert len(api_server.clients) == 1
+
+    def test_new_loop_gets_fresh_client(self, api_server):
+        """Test that a client bound to a finished event loop is replaced in a new one."""
+        datasource = api.API(spec=API_SPEC)
+        asyncio.run(datasource.request(get_user_request("1")))
+        asyncio.run(datasource.request(get_user_request("2")))
+        assert len(api_server.clients) == 2
+        assert api_server.clients[0] is not api_server.clients[1]
+
+    async def test_aclose_closes_client(self, api_server):
+        """Test that aclose closes the pooled client and a later request opens a new one."""
+        datasource = api.API(spec=API_SPEC)
+        await datasource.request(get_user_request("1"))
+        await datasource.aclose()
+        assert api_server.clients[0].is_closed
+        await datasource.request(get_user_request("2"))
+        assert len(api_server.clients) == 2
+
+    async def test_concurrent_requests_limited(self, api_server, monkeypatch):
+        """Test that no more than MAX_CONCURRENT_REQUESTS requests are in flight at once."""
+        monkeypatch.setattr(api, "MAX_CONCURRENT_REQUESTS", 2)
+        datasource = api.API(spec=API_SPEC)
+        await asyncio.gather(*(datasource.request(get_user_request(str(i))) for i in range(6)))
+        assert len(api_server.requests) == 6
+        assert api_server.peak_in_flight == 2
+
+    async def test_path_params_percent_encoded(self, api_server):
+        """Test that path parameter values cannot add segments or a query string to the URL."""
+        result = await api.API(spec=API_SPEC).request(get_user_request("a/b?c"))
+        assert result == {"path": "/u/a%2Fb%3Fc"}
+        assert api_server.requests[0].url.query == b""
@@ -0,0 +1,89 @@
+"""Unit tests for the Document datasource in toolfront.models.document."""
+
+from types import SimpleNamespace
+
+import pytest
+
+pytest.importorskip("markitdown")
+
+from toolfront.models import document  # noqa: E402
+from toolfront.models.document import Document  # noqa: E402
+
+
+class FakeMarkItDown:
+    """Stand-in converter that records how many conversions ran."""
+
+    calls = 0
+
+    def convert_stream(self, stream, stream_info):
+        FakeMarkItDown.calls += 1
+        return SimpleNamespace(markdown=f"converted {stream.read().decode()}")
+
+
+@pytest.fixture
+def fake_converter(monkeypatch, tmp_path):
+    """Route conversions through FakeMarkItDown and cache them under a temporary directory."""
+    FakeMarkItDown.calls = 0
+    monkeypatch.setattr(document, "MarkItDown", FakeMarkItDown)
+    monkeypatch.setattr(document, "CACHE_DIR", tmp_path / "cache")
+    return FakeMarkItDown
+
+
+class TestDocumentCache:
+    """Test cases for the document conversion cache."""
+
+    def test_cache_miss_converts_and_stores(self, fake_converter, tmp_path):
+        """Test that an uncached document is converted and its markdown written to the cache."""
+        source = tmp_path / "report.html"
+        source.write_text("hello")
+        assert Document(str(source)).text == "converted hello"
+        assert fake_converter.calls == 1
+        assert [path.read_text() for path in (tmp_path / "cache" / "documents").iterdir()] == ["converted hello"]
+
+    def test_cache_hit_skips_conversion(self, fake_converter, tmp_path):
+        """Test that identical content is served from the cache, even under another file name."""
+        (tmp_path / "a.html").write_text("hello")
+        (tmp_path / "b.html").write_text("hello")
+        Document(str(tmp_path / "a.html"))
+        assert Document(str(tmp_path / "b.html")).text == "converted hello"
+        assert fake_converter.calls == 1
+
+    def test_cache_key_includes_extension(self, fake_converter, tmp_path):
+        """Test that identical bytes with a different extension are converted separately."""
+        (tmp_path / "a.html").write_text("hello")
+        (tmp_path / "a.pdf").write_text("hello")
+        Document(str(tmp_path / "a.html"))
+        Document(str(tmp_path / "a.pdf"))
+        assert fake_converter.calls == 2
+
+    def test_cache_disabled(self, fake_converter, tmp_path):
+        """Test that cache=False converts every time and writes nothing to disk."""
+        source = tmp_path / "report.html"
+        source.write_text("hello")
+        Document(str(source), cache=False)
+        Document(str(source), cache=False)
+        assert fake_converter.calls == 2
+        assert not (tmp_path / "cache").exists()
+
+    def test_missing_file_raises_value_error(self, fake_converter, tmp_path):
+        """Test that a missing source file is reported as a validation error."""
+        with pytest.raises(ValueError, match="Document path does not exist"):
+            Document(str(tmp_path / "missing.pdf"))
+
+
+class TestDocumentConversion:
+    """Test cases for converting documents with markitdown."""
+
+    def test_html_converted_then_cached(self, monkeypatch, tmp_path):
+        """Test that an HTML file is converted to markdown and a second load is served from the cache."""
+        monkeypatch.setattr(document, "CACHE_DIR", tmp_path / "cache")
+        source = tmp_path / "page.html"
+        source.write_text("<html><body><h1>Title</h1><p>Some <b>bold</b> text.</p></body></html>")
+
+        markdown = Document(str(source)).text
+        assert "# Title" in markdown
+        assert "**bold**" in markdown
+
+        # Any further conversion would now fail, so the second load must come from the cache
+        monkeypatch.setattr(document, "MarkItDown", None)
+        assert Document(str(source)).text == markdown
@@ -0,0 +1,13 @@
+"""Unit tests for the ToolFront MCP server."""
+
+from toolfront.mcp import get_mcp
+
+
+class TestMCP:
+    """Test cases for the MCP server tools."""
+
+    async def test_query_returns_csv(self):
+        """Test that query results reach MCP clients serialized as CSV."""
+        mcp = await get_mcp("duckdb://")
+        result = await mcp.call_tool("query", {"query": {"code": "SELECT 1 AS x, [1, 2] AS l", "description": "Test"}})
+        assert [content.text for content in result] == ["x,l\n1,[1 2]\n"]
@@ -1,6 +1,11 @@
 """Unit tests for model validation logic in toolfront.models."""
 
-from toolfront.models.database import Table
+import pytest
+from pydantic import BaseModel
+
+from toolfront.config import MAX_DATA_ROWS
+from toolfront.models.database import Database, Query, Table
+from toolfront.utils import serialize_response
 
 
 class TestTable:
@@ -25,3 +30,70 @@ class TestTable:
         """Test that field description is set correctly."""
         field = Table.model_fields["path"]
         assert "Full table path in dot notation" in field.description
+
+
+class TestDatabase:
+    """Test cases for Database model."""
+
+    def test_tables_discovered_on_first_access(self, duckdb_database):
+        """Test that tables are listed lazily rather than at construction."""
+        # The fixture creates its table after construction, so it is only seen if discovery is deferred
+        assert duckdb_database.tables == ["memory.main.users"]
+
+    def test_invalid_match_tables_pattern(self):
+        """Test that invalid regex patterns are still rejected at construction."""
+        with pytest.raises(ValueError, match="Invalid regex pattern for match_tables"):
+            Database("duckdb://", match_tables="[")
+
+    async def test_query_limits_rows_fetched(self, duckdb_database):
+        """Test that large query results are truncated without counting the full result."""
+        result = await duckdb_database.query(Query(code=f"SELECT * FROM range({MAX_DATA_ROWS * 3})"))
+        assert result["data"].num_rows == MAX_DATA_ROWS
+        assert (
+            result["truncation_message"] == f"Showing {MAX_DATA_ROWS:,} rows of more than {MAX_DATA_ROWS:,} total rows"
+        )
+
+    async def test_query_small_result_not_truncated(self, duckdb_database):
+        """Test that small query results are returned as-is."""
+        result = await duckdb_database.query(Query(code="SELECT * FROM range(5)"))
+        assert result.num_rows == 5
+
+    async def test_inspect_table_schema(self, duckdb_database):
+        """Test that table inspection reports column names, types, and nullability."""
+        result = await duckdb_database.inspect_table(Table(path="users"))
+        assert result["schema"].to_pylist() == [
+            {"name": "id", "type": "!int32", "nullable": False},
+            {"name": "name", "type": "string", "nullable": True},
+        ]
+        assert result["samples"].num_rows == 0
+
+    def test_table_iterates_rows(self, duckdb_database):
+        """Test that Table results iterate as instances of the row model."""
+
+        class User(BaseModel):
+            id: int
+            name: str
+
+        table = duckdb_database.Table[User](query=Query(code="SELECT 1 AS id, 'Alice' AS name"))
+        assert list(table) == [User(id=1, name="Alice")]
+
+    async def test_query_interval_column(self, duckdb_database):
+        """Test that interval results Arrow cannot represent are still returned."""
+        result = await duckdb_database.query(Query(code="SELECT INTERVAL 90 MINUTE AS d"))
+        assert len(result) == 1
+        assert serialize_response(result).startswith("d\n")
+
+    async def test_query_interval_column_truncated(self, duckdb_database):
+        """Test that large interval results are truncated like Arrow results."""
+        result = await duckdb_database.query(
+            Query(code=f"SELECT to_minutes(range) AS d FROM range({MAX_DATA_ROWS * 3})")
+        )
+        assert len(result["data"]) == MAX_DATA_ROWS
+
+    async def test_inspect_table_interval_column(self):
+        """Test that tables with interval columns can be inspected."""
+        database = Database("duckdb://")
+        database.connection.raw_sql("CREATE TABLE durations AS SELECT INTERVAL 90 MINUTE AS d")
+        result = await database.inspect_table(Table(path="durations"))
+        assert result["schema"].to_pylist() == [{"name": "d", "type": "interval('us')", "nullable": True}]
+        assert len(result["samples"]) == 1